@@ -108,30 +108,23 @@ FROM python:3.9-slim
 
 WORKDIR /app
 
-# 安装系统依赖
-RUN apt-get update && apt-get install -y \
-    curl \
-    && rm -rf /var/lib/apt/lists/*
-
-# 安装kubectl
-RUN curl -LO "https://dl.k8s.io/release/$(curl -L -s https://dl.k8s.io/release/stable.txt)/bin/linux/amd64/kubectl" \
-    && chmod +x kubectl \
-    && mv kubectl /usr/local/bin/
-
 # 安装Python依赖
-RUN pip install flask flask-cors pyyaml
+# kubernetes 36起ApiClient.call_api的签名不兼容, /ready的/readyz检查依赖旧签名
+RUN pip install "flask>=2.3" flask-cors pyyaml "kubernetes>=28,<36" "gunicorn>=21,<24" \
+    "orjson>=3.9,<4" "pyrsistent>=0.19,<1" "pydantic>=2,<3"
 
-# 复制脚本
-COPY scripts/plugin-config-api.py .
+# PyYAML的manylinux wheel自带libyaml, 确认C加速可用
+RUN python -c "import yaml; assert yaml.__with_libyaml__"
 
-# 设置权限
-RUN chmod +x plugin-config-api.py
+# 复制脚本 (gunicorn按模块名加载, 文件名不能包含连字符)
+COPY scripts/plugin-config-api.py plugin_config_api.py
+COPY scripts/gunicorn_conf.py .
 
 # 暴露端口
 EXPOSE 8080
 
 # 启动命令
-CMD ["python", "plugin-config-api.py"]
+CMD ["gunicorn", "-c", "gunicorn_conf.py", "plugin_config_api:app"]
 EOF
 
     # 构建镜像
@@ -228,10 +221,12 @@ spec:
           periodSeconds: 10
         readinessProbe:
           httpGet:
-            path: /api/v1/health
+            path: /api/v1/ready
             port: 8080
           initialDelaySeconds: 5
           periodSeconds: 5
+          # 大于接口内apiserver检查的超时(HEALTH_CHECK_TIMEOUT=3s)
+          timeoutSeconds: 5
 ---
 apiVersion: v1
 kind: Service
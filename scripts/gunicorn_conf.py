@@ -0,0 +1,27 @@
+"""
+插件配置API服务的gunicorn配置
+用法: gunicorn -c gunicorn_conf.py plugin_config_api:app
+"""
+
+import os
+import sys
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 8080)}"
+
+# 接口以等待apiserver为主, 使用gthread在单进程内并发处理请求。
+# 每个worker进程各自持有ConfigMap缓存和重启防抖线程, 增加进程数会使
+# 不同进程收到的变更无法合并为一次重启, 因此默认只启动一个进程。
+worker_class = 'gthread'
+workers = int(os.getenv('GUNICORN_WORKERS', 1))
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+timeout = 60
+graceful_timeout = 30
+
+
+def on_starting(server):
+    """master启动时检查集群连接, 不可达则直接退出"""
+    from plugin_config_api import verify_cluster_connection
+    
+    if not verify_cluster_connection():
+        sys.exit(1)
@@ -5,15 +5,37 @@ Kubernetes调度器插件配置API服务
 """
 
 import os
-import json
+import collections
+import fnmatch
+import gzip
+import hashlib
+import time
+import queue
+import random
+import sys
+import threading
 import yaml
+import orjson
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from flask import Flask, request, jsonify, abort
+from typing import Callable, Deque, Dict, List, Literal, Mapping, Optional, Tuple, Any
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import subprocess
-import tempfile
+from kubernetes import client, config as k8s_config, watch
+from kubernetes.client.rest import ApiException
+from pydantic import (
+    BaseModel, ConfigDict, Field,
+    ValidationError, field_validator, model_validator
+)
+from pyrsistent import freeze, thaw
+
+# 优先使用libyaml的C实现, 不可用时回退到纯Python实现
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # 配置日志
 logging.basicConfig(
@@ -22,16 +44,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """使用orjson序列化请求和响应"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # 配置
 NAMESPACE = os.getenv('KUBERNETES_NAMESPACE', 'kube-system')
 CONFIGMAP_NAME = os.getenv('CONFIGMAP_NAME', 'rescheduler-config')
 SCHEDULER_DEPLOYMENT = os.getenv('SCHEDULER_DEPLOYMENT', 'rescheduler-scheduler')
+ROLLOUT_TIMEOUT = int(os.getenv('ROLLOUT_TIMEOUT', 300))
+ROLLOUT_POLL_INTERVAL = 2
+CACHE_SYNC_TIMEOUT = 2
+# watch由apiserver定期结束后重新list, 客户端读超时略大于该值, 用于发现半开连接
+WATCH_TIMEOUT = int(os.getenv('WATCH_TIMEOUT', 300))
+MUTATE_MAX_RETRIES = 5
+RESTART_DEBOUNCE = float(os.getenv('RESTART_DEBOUNCE', 2))
+HEALTH_CACHE_TTL = 5
+# 需小于部署中readinessProbe的timeoutSeconds
+HEALTH_CHECK_TIMEOUT = 3
+BACKUP_DIR = os.getenv('BACKUP_DIR', '/tmp')
+BACKUP_KEEP = int(os.getenv('BACKUP_KEEP', 20))
 
-# 支持的插件和阶段
-SUPPORTED_PLUGINS = [
+# 支持的插件和阶段 (元组保持顺序用于接口返回, 插件集合用于校验路径参数)
+SUPPORTED_PLUGINS_LIST = (
     "Rescheduler",
     "Coscheduling", 
     "CapacityScheduling",
@@ -44,9 +90,10 @@ SUPPORTED_PLUGINS = [
     "QoS",
     "SySched",
     "Trimaran"
-]
+)
+SUPPORTED_PLUGINS = frozenset(SUPPORTED_PLUGINS_LIST)
 
-PLUGIN_PHASES = [
+PLUGIN_PHASES_LIST = (
     "filter",
     "score", 
     "reserve",
@@ -56,7 +103,136 @@ PLUGIN_PHASES = [
     "permit",
     "bind",
     "postBind"
-]
+)
+
+def load_kube_config():
+    """加载集群凭据, 优先使用Pod内的ServiceAccount"""
+    try:
+        k8s_config.load_incluster_config()
+    except k8s_config.ConfigException:
+        k8s_config.load_kube_config()
+
+
+def verify_cluster_connection() -> bool:
+    """启动前检查apiserver是否可访问"""
+    try:
+        load_kube_config()
+        client.CoreV1Api().get_api_resources(_request_timeout=HEALTH_CHECK_TIMEOUT)
+        logger.info("Kubernetes连接正常")
+        return True
+    except ApiException as e:
+        logger.error(f"无法连接到Kubernetes集群: {e.reason}")
+    except Exception as e:
+        logger.error(f"无法连接到Kubernetes集群: {e}")
+    return False
+
+
+class ConfigConflictError(Exception):
+    """连续写入冲突, 重试次数耗尽"""
+
+
+class ConfigCache:
+    """ConfigMap内存缓存, 通过watch事件异步刷新
+    
+    解析后的配置以不可变结构(pyrsistent)保存, 读取方直接共享同一份数据,
+    修改时在副本上进行。
+    """
+    
+    def __init__(self, core: client.CoreV1Api, namespace: str, configmap_name: str):
+        self.core = core
+        self.namespace = namespace
+        self.configmap_name = configmap_name
+        self._lock = threading.RLock()
+        self._version_changed = threading.Condition(self._lock)
+        self._parsed: Optional[Mapping[str, Any]] = None
+        self._raw_yaml: Optional[str] = None
+        self._configmap: Optional[client.V1ConfigMap] = None
+        # 最近由watch观察到的resourceVersion, resourceVersion是不透明字符串, 只能按相等比较
+        self._seen_rvs: Deque[str] = collections.deque(maxlen=64)
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """启动后台watch线程"""
+        self._thread = threading.Thread(target=self._watch_loop, name='configmap-watch', daemon=True)
+        self._thread.start()
+    
+    def _watch_loop(self):
+        while True:
+            try:
+                for event in watch.Watch().stream(
+                    self.core.list_namespaced_config_map,
+                    namespace=self.namespace,
+                    field_selector=f'metadata.name={self.configmap_name}',
+                    timeout_seconds=WATCH_TIMEOUT,
+                    _request_timeout=WATCH_TIMEOUT + 10
+                ):
+                    if event['type'] in ('ADDED', 'MODIFIED'):
+                        self.store(event['object'])
+                    elif event['type'] == 'DELETED':
+                        self.invalidate()
+            except Exception as e:
+                # watch过期(410)或连接中断时重新建立, 期间读请求回退到直接读取
+                logger.warning(f"ConfigMap watch中断, 正在重连: {e}")
+                self.invalidate()
+                time.sleep(1)
+    
+    def store(self, configmap: client.V1ConfigMap):
+        """解析并缓存watch推送的ConfigMap"""
+        with self._lock:
+            self._seen_rvs.append(configmap.metadata.resource_version)
+            self._version_changed.notify_all()
+            
+            raw_yaml = (configmap.data or {}).get('config.yaml')
+            if raw_yaml is None:
+                logger.error(f"ConfigMap {self.configmap_name} 中缺少config.yaml")
+                self._clear()
+                return
+            if raw_yaml != self._raw_yaml:
+                try:
+                    self._parsed = freeze(yaml.load(raw_yaml, Loader=SafeLoader))
+                except Exception as e:
+                    logger.error(f"解析配置失败: {e}")
+                    self._clear()
+                    return
+                self._raw_yaml = raw_yaml
+            self._configmap = configmap
+    
+    def prime(self, configmap: client.V1ConfigMap):
+        """用直接读取或写入的结果填充缓存
+        
+        只在缓存为空时生效, 避免覆盖watch已经推送的更新版本。
+        """
+        with self._lock:
+            if self._parsed is None:
+                self.store(configmap)
+    
+    def invalidate(self):
+        with self._lock:
+            self._clear()
+            self._seen_rvs.clear()
+    
+    def _clear(self):
+        self._parsed = None
+        self._raw_yaml = None
+        self._configmap = None
+    
+    def get(self) -> Optional[Mapping[str, Any]]:
+        """返回缓存的只读配置, 缓存未就绪时返回None"""
+        with self._lock:
+            return self._parsed
+    
+    def snapshot(self) -> Optional[Tuple[Mapping[str, Any], client.V1ConfigMap]]:
+        """返回缓存的只读配置及对应的ConfigMap对象, 缓存未就绪时返回None"""
+        with self._lock:
+            if self._parsed is None:
+                return None
+            return self._parsed, self._configmap
+    
+    def wait_for(self, rv: str, timeout: float = CACHE_SYNC_TIMEOUT) -> bool:
+        """等待watch追上指定版本, 保证写后读一致"""
+        with self._version_changed:
+            return self._version_changed.wait_for(lambda: rv in self._seen_rvs, timeout)
+
 
 class PluginConfigManager:
     """插件配置管理器"""
@@ -65,115 +241,278 @@ class PluginConfigManager:
         self.namespace = NAMESPACE
         self.configmap_name = CONFIGMAP_NAME
         self.scheduler_deployment = SCHEDULER_DEPLOYMENT
+        
+        # 加载集群凭据, 所有请求复用同一个ApiClient连接池
+        load_kube_config()
+        self.core = client.CoreV1Api()
+        self.apps = client.AppsV1Api()
+        
+        self.cache = ConfigCache(self.core, self.namespace, self.configmap_name)
+        self.cache.start()
+        
+        # 调度器重启在后台执行, 防抖窗口内的多次请求合并为一次滚动更新
+        self._restart_queue: "queue.Queue[float]" = queue.Queue()
+        self._restart_pending = False
+        self._restart_in_progress = False
+        self._last_restart_ok: Optional[bool] = None
+        threading.Thread(target=self._restart_worker, name='scheduler-restart', daemon=True).start()
+        
+        # 备份文件在后台写入, 不占用请求路径
+        self._backup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='config-backup')
+        
+        # 集群连接检查结果短时缓存, 避免探针风暴打到apiserver
+        self._health_lock = threading.Lock()
+        self._health_ts = float('-inf')
+        self._health_val = False
+        
+        # 插件状态响应体, 按resourceVersion缓存
+        self._status_lock = threading.Lock()
+        self._status_rv: Optional[str] = None
+        self._status_body = b''
     
-    def get_current_config(self) -> Dict[str, Any]:
-        """获取当前配置"""
-        try:
-            cmd = [
-                'kubectl', 'get', 'configmap', self.configmap_name,
-                '-n', self.namespace, '-o', 'json'
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            config_data = json.loads(result.stdout)
+    def check_cluster(self) -> bool:
+        """检查apiserver是否就绪, 结果缓存HEALTH_CACHE_TTL秒"""
+        with self._health_lock:
+            if time.monotonic() - self._health_ts < HEALTH_CACHE_TTL:
+                return self._health_val
             
-            # 解析YAML配置
-            yaml_config = yaml.safe_load(config_data['data']['config.yaml'])
-            return yaml_config
-        except subprocess.CalledProcessError as e:
-            logger.error(f"获取配置失败: {e.stderr}")
-            raise Exception(f"获取配置失败: {e.stderr}")
+            try:
+                # 此为kubernetes<36的call_api签名, 版本在部署脚本中固定
+                resp = self.core.api_client.call_api(
+                    '/readyz', 'GET',
+                    auth_settings=['BearerToken'],
+                    _preload_content=False,
+                    _return_http_data_only=True,
+                    _request_timeout=HEALTH_CHECK_TIMEOUT
+                )
+                self._health_val = resp.status == 200
+                resp.release_conn()
+            except Exception as e:
+                logger.warning(f"Kubernetes连接检查失败: {e}")
+                self._health_val = False
+            self._health_ts = time.monotonic()
+            return self._health_val
+    
+    def get_current_config(self) -> Mapping[str, Any]:
+        """获取当前配置(只读)"""
+        cached = self.cache.get()
+        if cached is not None:
+            return cached
+        
+        # 缓存尚未同步, 直接读取并写入缓存
+        try:
+            config, _ = self._read_configmap()
+            return config
+        except ApiException as e:
+            logger.error(f"获取配置失败: {e.reason}")
+            raise Exception(f"获取配置失败: {e.reason}")
         except Exception as e:
             logger.error(f"解析配置失败: {e}")
             raise Exception(f"解析配置失败: {e}")
     
-    def update_config(self, new_config: Dict[str, Any]) -> bool:
-        """更新配置"""
+    def backup_config(self, config: Optional[Mapping[str, Any]] = None):
+        """备份配置, 写文件在后台线程执行
+        
+        config为空时备份当前配置
+        """
         try:
-            # 备份当前配置
-            self.backup_config()
-            
-            # 转换为YAML
-            yaml_content = yaml.dump(new_config, default_flow_style=False)
-            
-            # 更新ConfigMap
-            cmd = [
-                'kubectl', 'patch', 'configmap', self.configmap_name,
-                '-n', self.namespace, '--type', 'merge',
-                '-p', json.dumps({
-                    'data': {
-                        'config.yaml': yaml_content
-                    }
-                })
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            logger.info("配置更新成功")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            logger.error(f"更新配置失败: {e.stderr}")
-            return False
+            if config is None:
+                config = self.get_current_config()
+            self._backup_executor.submit(self._write_backup, config)
         except Exception as e:
-            logger.error(f"更新配置失败: {e}")
-            return False
+            logger.warning(f"配置备份失败: {e}")
     
-    def backup_config(self):
-        """备份当前配置"""
+    def _write_backup(self, config: Mapping[str, Any]):
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = f"/tmp/config_backup_{timestamp}.yaml"
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            backup_file = os.path.join(BACKUP_DIR, f"config_backup_{timestamp}.yaml.gz")
             
-            cmd = [
-                'kubectl', 'get', 'configmap', self.configmap_name,
-                '-n', self.namespace, '-o', 'yaml'
-            ]
-            
-            with open(backup_file, 'w') as f:
-                subprocess.run(cmd, stdout=f, check=True)
+            with gzip.open(backup_file, 'wt', encoding='utf-8') as f:
+                yaml.dump(thaw(config), f, Dumper=SafeDumper, default_flow_style=False)
             
             logger.info(f"配置已备份到: {backup_file}")
+            self._rotate_backups()
             
         except Exception as e:
             logger.warning(f"配置备份失败: {e}")
     
+    def _rotate_backups(self):
+        """只保留最新的BACKUP_KEEP个备份文件"""
+        with os.scandir(BACKUP_DIR) as entries:
+            backups = [
+                entry for entry in entries
+                if entry.is_file() and fnmatch.fnmatch(entry.name, 'config_backup_*.yaml.gz')
+            ]
+        backups.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in backups[BACKUP_KEEP:]:
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                logger.warning(f"删除旧备份失败: {entry.path}: {e}")
+    
+    def _read_configmap(self) -> Tuple[Mapping[str, Any], client.V1ConfigMap]:
+        """直接从apiserver读取配置及ConfigMap对象, 并刷新缓存"""
+        configmap = self.core.read_namespaced_config_map(self.configmap_name, self.namespace)
+        self.cache.prime(configmap)
+        
+        # 缓存中已是同一版本时直接复用其解析结果, 避免重复解析YAML
+        snapshot = self.cache.snapshot()
+        rv = configmap.metadata.resource_version
+        if snapshot is not None and snapshot[1].metadata.resource_version == rv:
+            return snapshot
+        config = yaml.load(configmap.data['config.yaml'], Loader=SafeLoader)
+        return freeze(config), configmap
+    
+    def _mutate(self, fn: Callable[[Dict[str, Any]], None]) -> bool:
+        """对配置执行一次读取-修改-写入
+        
+        fn原地修改配置。写入使用带resourceVersion的replace, 发生409冲突时
+        退避后重新读取并重放fn。写入成功后异步备份修改前的配置并提交调度器重启。
+        连续MUTATE_MAX_RETRIES次冲突时抛出ConfigConflictError。
+        """
+        snapshot = self.cache.snapshot()
+        for attempt in range(MUTATE_MAX_RETRIES):
+            try:
+                if snapshot is None:
+                    snapshot = self._read_configmap()
+                original, current = snapshot
+                
+                # 只在写入时生成可修改的副本
+                config = thaw(original)
+                fn(config)
+                if freeze(config) == original:
+                    logger.info("配置未变化, 跳过更新")
+                    return True
+                
+                yaml_content = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False)
+                # metadata中携带读取时的resourceVersion, 期间被修改则apiserver返回409
+                body = client.V1ConfigMap(
+                    metadata=current.metadata,
+                    data={**current.data, 'config.yaml': yaml_content},
+                    binary_data=current.binary_data,
+                    immutable=current.immutable
+                )
+                configmap = self.core.replace_namespaced_config_map(
+                    self.configmap_name, self.namespace, body
+                )
+            except ApiException as e:
+                if e.status == 409:
+                    logger.warning("配置已被其他请求修改, 重新读取后重试")
+                    if attempt + 1 < MUTATE_MAX_RETRIES:
+                        time.sleep(0.05 * 2 ** attempt + random.random() * 0.05)
+                    snapshot = None
+                    continue
+                logger.error(f"更新配置失败: {e.reason}")
+                return False
+            except Exception as e:
+                logger.error(f"更新配置失败: {e}")
+                return False
+            
+            self.backup_config(original)
+            
+            # 等待watch刷新缓存, 超时且缓存为空时用写入结果填充
+            if not self.cache.wait_for(configmap.metadata.resource_version):
+                self.cache.prime(configmap)
+            logger.info("配置更新成功")
+            
+            self.request_restart()
+            return True
+        
+        logger.error(f"更新配置失败: 连续{MUTATE_MAX_RETRIES}次写入冲突")
+        raise ConfigConflictError(f"配置被并发修改, 连续{MUTATE_MAX_RETRIES}次写入冲突, 请稍后重试")
+    
     def restart_scheduler(self) -> bool:
         """重启调度器"""
         try:
-            cmd = [
-                'kubectl', 'rollout', 'restart', f'deployment/{self.scheduler_deployment}',
-                '-n', self.namespace
-            ]
-            
-            subprocess.run(cmd, check=True)
+            # 与 kubectl rollout restart 相同: 修改Pod模板注解触发滚动更新
+            patch = {
+                'spec': {
+                    'template': {
+                        'metadata': {
+                            'annotations': {
+                                'kubectl.kubernetes.io/restartedAt': datetime.utcnow().isoformat()
+                            }
+                        }
+                    }
+                }
+            }
+            deployment = self.apps.patch_namespaced_deployment(
+                self.scheduler_deployment, self.namespace, body=patch
+            )
             
             # 等待重启完成
-            cmd = [
-                'kubectl', 'rollout', 'status', f'deployment/{self.scheduler_deployment}',
-                '-n', self.namespace, '--timeout=300s'
-            ]
-            
-            subprocess.run(cmd, check=True)
+            if not self._wait_for_rollout(deployment.metadata.generation):
+                logger.error(f"调度器重启超时: {ROLLOUT_TIMEOUT}s")
+                return False
             logger.info("调度器重启成功")
             return True
             
-        except subprocess.CalledProcessError as e:
-            logger.error(f"重启调度器失败: {e.stderr}")
+        except ApiException as e:
+            logger.error(f"重启调度器失败: {e.reason}")
             return False
         except Exception as e:
             logger.error(f"重启调度器失败: {e}")
             return False
     
-    def enable_plugin(self, plugin_name: str, phases: List[str]) -> Dict[str, Any]:
-        """启用插件"""
-        if plugin_name not in SUPPORTED_PLUGINS:
-            raise ValueError(f"不支持的插件: {plugin_name}")
-        
-        for phase in phases:
-            if phase not in PLUGIN_PHASES:
-                raise ValueError(f"不支持的阶段: {phase}")
-        
-        config = self.get_current_config()
-        
+    def request_restart(self):
+        """提交一次调度器重启请求, 由后台线程异步执行"""
+        self._restart_queue.put(time.monotonic())
+    
+    def _restart_worker(self):
+        while True:
+            self._restart_queue.get()
+            # 请求已出队但尚未执行, 防抖期间仍需报告为待处理
+            self._restart_pending = True
+            time.sleep(RESTART_DEBOUNCE)
+            
+            # 合并防抖窗口内累积的请求
+            while True:
+                try:
+                    self._restart_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            self._restart_in_progress = True
+            self._restart_pending = False
+            try:
+                self._last_restart_ok = self.restart_scheduler()
+            finally:
+                self._restart_in_progress = False
+    
+    def get_restart_status(self) -> Dict[str, Any]:
+        """获取调度器重启状态"""
+        deployment = self.apps.read_namespaced_deployment(
+            self.scheduler_deployment, self.namespace
+        )
+        return {
+            'pending': self._restart_pending or not self._restart_queue.empty(),
+            'in_progress': self._restart_in_progress,
+            'last_restart_succeeded': self._last_restart_ok,
+            'replicas': deployment.spec.replicas or 0,
+            'updated_replicas': deployment.status.updated_replicas or 0,
+            'available_replicas': deployment.status.available_replicas or 0
+        }
+    
+    def _wait_for_rollout(self, generation: int) -> bool:
+        """轮询Deployment状态直到新版本的副本全部就绪"""
+        deadline = time.monotonic() + ROLLOUT_TIMEOUT
+        while time.monotonic() < deadline:
+            # 读取Deployment本身即可获得status, 不需要deployments/status子资源权限
+            deployment = self.apps.read_namespaced_deployment(
+                self.scheduler_deployment, self.namespace
+            )
+            status = deployment.status
+            replicas = deployment.spec.replicas or 0
+            if ((status.observed_generation or 0) >= generation
+                    and (status.updated_replicas or 0) == replicas
+                    and (status.replicas or 0) == replicas
+                    and (status.available_replicas or 0) == replicas):
+                return True
+            time.sleep(ROLLOUT_POLL_INTERVAL)
+        return False
+    
+    def _phase_lists(self, config: Dict[str, Any], phase: str) -> Dict[str, List[str]]:
+        """返回指定阶段的enabled/disabled列表, 不存在时创建"""
         # 确保profiles结构存在
         if 'profiles' not in config:
             config['profiles'] = [{'schedulerName': 'rescheduler-scheduler', 'plugins': {}}]
@@ -182,95 +521,44 @@ class PluginConfigManager:
         if 'plugins' not in profile:
             profile['plugins'] = {}
         
-        # 为每个阶段添加插件
+        if phase not in profile['plugins']:
+            profile['plugins'][phase] = {'enabled': [], 'disabled': []}
+        
+        if 'enabled' not in profile['plugins'][phase]:
+            profile['plugins'][phase]['enabled'] = []
+        if 'disabled' not in profile['plugins'][phase]:
+            profile['plugins'][phase]['disabled'] = []
+        
+        return profile['plugins'][phase]
+    
+    def _apply_enable(self, config: Dict[str, Any], plugin_name: str, phases: List[str]):
+        """在配置中为每个阶段启用插件"""
         for phase in phases:
-            if phase not in profile['plugins']:
-                profile['plugins'][phase] = {'enabled': [], 'disabled': []}
-            
-            if 'enabled' not in profile['plugins'][phase]:
-                profile['plugins'][phase]['enabled'] = []
-            if 'disabled' not in profile['plugins'][phase]:
-                profile['plugins'][phase]['disabled'] = []
+            phase_config = self._phase_lists(config, phase)
             
             # 添加到enabled列表
-            if plugin_name not in profile['plugins'][phase]['enabled']:
-                profile['plugins'][phase]['enabled'].append(plugin_name)
+            if plugin_name not in phase_config['enabled']:
+                phase_config['enabled'].append(plugin_name)
             
             # 从disabled列表移除
-            if plugin_name in profile['plugins'][phase]['disabled']:
-                profile['plugins'][phase]['disabled'].remove(plugin_name)
-        
-        # 更新配置
-        if self.update_config(config):
-            self.restart_scheduler()
-            return {
-                'status': 'success',
-                'message': f'插件 {plugin_name} 在阶段 {phases} 中启用成功',
-                'plugin': plugin_name,
-                'phases': phases
-            }
-        else:
-            return {
-                'status': 'error',
-                'message': f'插件 {plugin_name} 启用失败'
-            }
+            if plugin_name in phase_config['disabled']:
+                phase_config['disabled'].remove(plugin_name)
     
-    def disable_plugin(self, plugin_name: str, phases: List[str]) -> Dict[str, Any]:
-        """禁用插件"""
-        if plugin_name not in SUPPORTED_PLUGINS:
-            raise ValueError(f"不支持的插件: {plugin_name}")
-        
-        for phase in phases:
-            if phase not in PLUGIN_PHASES:
-                raise ValueError(f"不支持的阶段: {phase}")
-        
-        config = self.get_current_config()
-        
-        # 确保profiles结构存在
-        if 'profiles' not in config:
-            config['profiles'] = [{'schedulerName': 'rescheduler-scheduler', 'plugins': {}}]
-        
-        profile = config['profiles'][0]
-        if 'plugins' not in profile:
-            profile['plugins'] = {}
-        
-        # 为每个阶段禁用插件
+    def _apply_disable(self, config: Dict[str, Any], plugin_name: str, phases: List[str]):
+        """在配置中为每个阶段禁用插件"""
         for phase in phases:
-            if phase not in profile['plugins']:
-                profile['plugins'][phase] = {'enabled': [], 'disabled': []}
-            
-            if 'enabled' not in profile['plugins'][phase]:
-                profile['plugins'][phase]['enabled'] = []
-            if 'disabled' not in profile['plugins'][phase]:
-                profile['plugins'][phase]['disabled'] = []
+            phase_config = self._phase_lists(config, phase)
             
             # 从enabled列表移除
-            if plugin_name in profile['plugins'][phase]['enabled']:
-                profile['plugins'][phase]['enabled'].remove(plugin_name)
+            if plugin_name in phase_config['enabled']:
+                phase_config['enabled'].remove(plugin_name)
             
             # 添加到disabled列表
-            if plugin_name not in profile['plugins'][phase]['disabled']:
-                profile['plugins'][phase]['disabled'].append(plugin_name)
-        
-        # 更新配置
-        if self.update_config(config):
-            self.restart_scheduler()
-            return {
-                'status': 'success',
-                'message': f'插件 {plugin_name} 在阶段 {phases} 中禁用成功',
-                'plugin': plugin_name,
-                'phases': phases
-            }
-        else:
-            return {
-                'status': 'error',
-                'message': f'插件 {plugin_name} 禁用失败'
-            }
+            if plugin_name not in phase_config['disabled']:
+                phase_config['disabled'].append(plugin_name)
     
-    def update_plugin_config(self, plugin_name: str, config_key: str, config_value: Any) -> Dict[str, Any]:
-        """更新插件配置"""
-        config = self.get_current_config()
-        
+    def _apply_plugin_args(self, config: Dict[str, Any], plugin_name: str, kv: Dict[str, Any]):
+        """在配置中更新插件参数"""
         # 确保profiles结构存在
         if 'profiles' not in config:
             config['profiles'] = [{'schedulerName': 'rescheduler-scheduler', 'pluginConfig': []}]
@@ -295,16 +583,46 @@ class PluginConfigManager:
         if 'args' not in plugin_config:
             plugin_config['args'] = {}
         
-        plugin_config['args'][config_key] = config_value
-        
-        # 更新配置
-        if self.update_config(config):
-            self.restart_scheduler()
+        plugin_config['args'].update(kv)
+    
+    def enable_plugin(self, plugin_name: str, phases: List[str]) -> Dict[str, Any]:
+        """启用插件"""
+        if self._mutate(lambda config: self._apply_enable(config, plugin_name, phases)):
             return {
                 'status': 'success',
-                'message': f'插件 {plugin_name} 配置 {config_key} 更新为 {config_value}',
+                'message': f'插件 {plugin_name} 在阶段 {phases} 中启用成功',
                 'plugin': plugin_name,
-                'config': {config_key: config_value}
+                'phases': phases
+            }
+        else:
+            return {
+                'status': 'error',
+                'message': f'插件 {plugin_name} 启用失败'
+            }
+    
+    def disable_plugin(self, plugin_name: str, phases: List[str]) -> Dict[str, Any]:
+        """禁用插件"""
+        if self._mutate(lambda config: self._apply_disable(config, plugin_name, phases)):
+            return {
+                'status': 'success',
+                'message': f'插件 {plugin_name} 在阶段 {phases} 中禁用成功',
+                'plugin': plugin_name,
+                'phases': phases
+            }
+        else:
+            return {
+                'status': 'error',
+                'message': f'插件 {plugin_name} 禁用失败'
+            }
+    
+    def update_plugin_configs(self, plugin_name: str, kv: Dict[str, Any]) -> Dict[str, Any]:
+        """一次写入插件的多个配置项, 只重启一次调度器"""
+        if self._mutate(lambda config: self._apply_plugin_args(config, plugin_name, kv)):
+            return {
+                'status': 'success',
+                'message': f'插件 {plugin_name} 配置 {list(kv)} 更新成功',
+                'plugin': plugin_name,
+                'config': kv
             }
         else:
             return {
@@ -312,10 +630,113 @@ class PluginConfigManager:
                 'message': f'插件 {plugin_name} 配置更新失败'
             }
     
+    def _apply_op(self, config: Dict[str, Any], op: Dict[str, Any]):
+        """在配置中应用单个变更操作"""
+        if op['type'] == 'enable':
+            self._apply_enable(config, op['plugin'], op['phases'])
+        elif op['type'] == 'disable':
+            self._apply_disable(config, op['plugin'], op['phases'])
+        else:
+            self._apply_plugin_args(config, op['plugin'], op['args'])
+    
+    def _apply_ops(self, ops: List[Dict[str, Any]]) -> bool:
+        """在同一次读取-修改-写入中依次应用全部操作
+        
+        操作的合法性由请求体模型(OpReq/ChangeReq)负责校验。
+        """
+        def apply(config: Dict[str, Any]):
+            for op in ops:
+                self._apply_op(config, op)
+        
+        return self._mutate(apply)
+    
+    def apply_plugin_changes(self, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """批量启用/禁用插件, 合并为一次配置写入和一次调度器重启
+        
+        changes: [{'action': 'enable'|'disable', 'plugin': str, 'phases': [str]}, ...]
+        """
+        ops = [
+            {'type': change['action'], 'plugin': change['plugin'], 'phases': change['phases']}
+            for change in changes
+        ]
+        if self._apply_ops(ops):
+            return {
+                'status': 'success',
+                'message': f'批量变更 {len(changes)} 项应用成功',
+                'changes': changes
+            }
+        else:
+            return {
+                'status': 'error',
+                'message': '批量变更应用失败'
+            }
+    
+    def update_multi_plugin_configs(self, configs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """更新多个插件的配置
+        
+        所有插件写的是同一个ConfigMap, 并行写入只会互相冲突, 因此合并为
+        一次读取-修改-写入, 只产生一次备份和一次调度器重启。
+        configs: {plugin_name: {key: value}, ...}
+        """
+        ops = [
+            {'type': 'config', 'plugin': plugin_name, 'args': kv}
+            for plugin_name, kv in configs.items()
+        ]
+        if self._apply_ops(ops):
+            return {
+                'status': 'success',
+                'message': f'{len(configs)} 个插件配置更新完成',
+                'results': [
+                    {'plugin': plugin_name, 'config': kv}
+                    for plugin_name, kv in configs.items()
+                ]
+            }
+        else:
+            return {
+                'status': 'error',
+                'message': f'{len(configs)} 个插件配置更新失败'
+            }
+    
+    def apply_transaction(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """在同一个配置版本上原子地应用启用/禁用/配置操作, 只重启一次调度器
+        
+        ops: [{'type': 'enable'|'disable'|'config', 'plugin': str,
+               'phases': [str], 'args': {...}}, ...]
+        """
+        if self._apply_ops(ops):
+            return {
+                'status': 'success',
+                'message': f'事务 {len(ops)} 项操作应用成功',
+                'ops': ops
+            }
+        else:
+            return {
+                'status': 'error',
+                'message': '事务应用失败'
+            }
+    
     def get_plugin_status(self) -> Dict[str, Any]:
         """获取插件状态"""
-        config = self.get_current_config()
+        return self._build_status(self.get_current_config())
+    
+    def get_plugin_status_body(self) -> Tuple[str, bytes]:
+        """返回当前resourceVersion及序列化好的插件状态响应体
         
+        响应体按resourceVersion缓存, 配置未变化时直接复用。
+        """
+        config, configmap = self.cache.snapshot() or self._read_configmap()
+        rv = configmap.metadata.resource_version
+        with self._status_lock:
+            if self._status_rv != rv:
+                self._status_body = orjson.dumps({
+                    'status': 'success',
+                    'data': self._build_status(config)
+                }, option=orjson.OPT_NON_STR_KEYS)
+                self._status_rv = rv
+            return rv, self._status_body
+    
+    def _build_status(self, config: Mapping[str, Any]) -> Dict[str, Any]:
+        """从配置中提取插件状态"""
         status = {
             'enabled_plugins': {},
             'disabled_plugins': {},
@@ -329,31 +750,179 @@ class PluginConfigManager:
             if 'plugins' in profile:
                 for phase, phase_config in profile['plugins'].items():
                     if 'enabled' in phase_config:
-                        status['enabled_plugins'][phase] = phase_config['enabled']
+                        status['enabled_plugins'][phase] = thaw(phase_config['enabled'])
                     if 'disabled' in phase_config:
-                        status['disabled_plugins'][phase] = phase_config['disabled']
+                        status['disabled_plugins'][phase] = thaw(phase_config['disabled'])
             
             # 获取插件配置
             if 'pluginConfig' in profile:
                 for pc in profile['pluginConfig']:
-                    status['plugin_configs'][pc['name']] = pc.get('args', {})
+                    status['plugin_configs'][pc['name']] = thaw(pc.get('args', {}))
         
         return status
 
-# 创建管理器实例
-config_manager = PluginConfigManager()
+# 管理器实例在首次请求时创建, 保证gunicorn fork之后才启动后台线程
+_config_manager: Optional[PluginConfigManager] = None
+_config_manager_lock = threading.Lock()
+
+def get_config_manager() -> PluginConfigManager:
+    """获取进程内唯一的管理器实例"""
+    global _config_manager
+    if _config_manager is None:
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = PluginConfigManager()
+    return _config_manager
+
+
+# 请求体模型, 在访问apiserver之前拒绝格式错误的请求
+Phase = Literal[PLUGIN_PHASES_LIST]
+PluginName = Literal[SUPPORTED_PLUGINS_LIST]
+
+
+class PhasesReq(BaseModel):
+    """启用/禁用插件的请求体"""
+    phases: List[Phase] = Field(default_factory=lambda: ['filter', 'score'], min_length=1)
+    
+    @field_validator('phases', mode='before')
+    @classmethod
+    def _wrap_single_phase(cls, v: Any) -> Any:
+        return v if isinstance(v, list) else [v]
+
+
+class ChangeReq(PhasesReq):
+    action: Literal['enable', 'disable']
+    plugin: PluginName
+
+
+class BatchReq(BaseModel):
+    changes: List[ChangeReq] = Field(min_length=1)
+
+
+class OpReq(BaseModel):
+    """事务中的单个操作, phases只用于enable/disable, args只用于config"""
+    model_config = ConfigDict(extra='forbid')
+    
+    type: Literal['enable', 'disable', 'config']
+    plugin: str = Field(min_length=1)
+    phases: Optional[List[Phase]] = None
+    args: Optional[Dict[str, Any]] = None
+    
+    @field_validator('phases', mode='before')
+    @classmethod
+    def _wrap_single_phase(cls, v: Any) -> Any:
+        return v if v is None or isinstance(v, list) else [v]
+    
+    @model_validator(mode='after')
+    def _check_op(self) -> 'OpReq':
+        if self.type == 'config':
+            if self.phases is not None:
+                raise ValueError("config操作不接受phases")
+            if not self.args:
+                raise ValueError(f"插件 {self.plugin} 的args必须是非空对象")
+            self.args = validate_plugin_args(self.plugin, self.args)
+        else:
+            if self.args is not None:
+                raise ValueError(f"{self.type}操作不接受args")
+            if self.plugin not in SUPPORTED_PLUGINS:
+                raise ValueError(f"不支持的插件: {self.plugin}")
+            if self.phases is None:
+                self.phases = ['filter', 'score']
+            elif not self.phases:
+                raise ValueError("phases不能为空")
+        return self
+
+
+class TransactionReq(BaseModel):
+    ops: List[OpReq] = Field(min_length=1)
+
+
+# 已知插件参数的类型约束, 与apis/config/v1/types.go保持一致。
+# Web UI以字符串提交参数值, 这里按宽松模式将"30"、"true"等转换为对应类型。
+# 未列出的参数名仍然允许, 便于支持新版本调度器增加的参数。
+class CoschedulingArgs(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    permitWaitingTimeSeconds: Optional[int] = Field(None, ge=0)
+    podGroupBackoffSeconds: Optional[int] = Field(None, ge=0)
+
+
+class TargetLoadPackingArgs(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    targetUtilization: Optional[int] = Field(None, ge=0, le=100)
+    defaultRequestsMultiplier: Optional[str] = None
+
+
+class LoadVariationRiskBalancingArgs(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    safeVarianceMargin: Optional[float] = Field(None, ge=0)
+    safeVarianceSensitivity: Optional[float] = Field(None, ge=0)
+
+
+class NodeResourceTopologyMatchArgs(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    cacheResyncPeriodSeconds: Optional[int] = Field(None, ge=0)
+    discardReservedNodes: Optional[bool] = None
+
+
+class SySchedArgs(BaseModel):
+    model_config = ConfigDict(extra='allow')
+    defaultProfileNamespace: Optional[str] = None
+    defaultProfileName: Optional[str] = None
+
+
+PLUGIN_ARGS_MODELS = {
+    'Coscheduling': CoschedulingArgs,
+    'TargetLoadPacking': TargetLoadPackingArgs,
+    'LoadVariationRiskBalancing': LoadVariationRiskBalancingArgs,
+    'NodeResourceTopologyMatch': NodeResourceTopologyMatchArgs,
+    'SySched': SySchedArgs,
+}
+
+
+def validate_plugin_args(plugin_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """按已知的插件参数类型校验args, 返回校验后的参数"""
+    model = PLUGIN_ARGS_MODELS.get(plugin_name)
+    if model is None:
+        return args
+    return model.model_validate(args).model_dump(exclude_unset=True)
+
+
+def _json_body() -> Dict[str, Any]:
+    """读取JSON请求体, 空请求体视为{}
+    
+    请求体不是合法的JSON对象(含缺少application/json的Content-Type)时抛出ValueError,
+    由路由按400返回, 而不是让flask的BadRequest落入500分支。
+    """
+    if not request.get_data(cache=True):
+        return {}
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise ValueError('请求体必须是Content-Type为application/json的JSON对象')
+    return data
+
+
+def _validation_error(e: ValidationError):
+    """将请求体校验错误转换为400响应"""
+    message = '; '.join(
+        f"{'.'.join(str(loc) for loc in err['loc']) or 'body'}: {err['msg']}"
+        for err in e.errors()
+    )
+    return jsonify({
+        'status': 'error',
+        'message': f'请求参数错误: {message}'
+    }), 400
 
 # API路由
 @app.route('/api/v1/plugins', methods=['GET'])
 def get_plugins():
     """获取所有插件状态"""
     try:
-        status = config_manager.get_plugin_status()
+        status = get_config_manager().get_plugin_status()
         return jsonify({
             'status': 'success',
             'data': status,
-            'supported_plugins': SUPPORTED_PLUGINS,
-            'supported_phases': PLUGIN_PHASES
+            'supported_plugins': SUPPORTED_PLUGINS_LIST,
+            'supported_phases': PLUGIN_PHASES_LIST
         })
     except Exception as e:
         logger.error(f"获取插件状态失败: {e}")
@@ -362,18 +931,64 @@ def get_plugins():
             'message': str(e)
         }), 500
 
+# 插件和阶段列表不会变化, 响应体与ETag在启动时生成
+_CATALOG_BODY = orjson.dumps({
+    'status': 'success',
+    'supported_plugins': SUPPORTED_PLUGINS_LIST,
+    'supported_phases': PLUGIN_PHASES_LIST
+})
+_CATALOG_ETAG = hashlib.sha1(_CATALOG_BODY).hexdigest()
+
+@app.route('/api/v1/plugins/catalog', methods=['GET'])
+def get_plugin_catalog():
+    """获取支持的插件和阶段"""
+    if request.if_none_match.contains(_CATALOG_ETAG):
+        response = Response(status=304)
+    else:
+        response = Response(_CATALOG_BODY, mimetype='application/json')
+    response.set_etag(_CATALOG_ETAG)
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+@app.route('/api/v1/plugins/status', methods=['GET'])
+def get_plugins_status():
+    """获取插件状态, 以ConfigMap的resourceVersion作为ETag"""
+    try:
+        rv, body = get_config_manager().get_plugin_status_body()
+        if request.if_none_match.contains(rv):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(rv)
+        # 允许客户端缓存, 但每次使用前需要重新验证
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+    except Exception as e:
+        logger.error(f"获取插件状态失败: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/v1/plugins/<plugin_name>/enable', methods=['POST'])
 def enable_plugin(plugin_name):
     """启用插件"""
     try:
-        data = request.get_json() or {}
-        phases = data.get('phases', ['filter', 'score'])
-        
-        if not isinstance(phases, list):
-            phases = [phases]
+        if plugin_name not in SUPPORTED_PLUGINS:
+            raise ValueError(f"不支持的插件: {plugin_name}")
+        body = PhasesReq.model_validate(_json_body())
         
-        result = config_manager.enable_plugin(plugin_name, phases)
-        return jsonify(result)
+        result = get_config_manager().enable_plugin(plugin_name, body.phases)
+        if result['status'] != 'success':
+            return jsonify(result), 500
+        return jsonify(result), 202
+    except ConfigConflictError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 409
+    except ValidationError as e:
+        return _validation_error(e)
     except ValueError as e:
         return jsonify({
             'status': 'error',
@@ -390,14 +1005,21 @@ def enable_plugin(plugin_name):
 def disable_plugin(plugin_name):
     """禁用插件"""
     try:
-        data = request.get_json() or {}
-        phases = data.get('phases', ['filter', 'score'])
-        
-        if not isinstance(phases, list):
-            phases = [phases]
+        if plugin_name not in SUPPORTED_PLUGINS:
+            raise ValueError(f"不支持的插件: {plugin_name}")
+        body = PhasesReq.model_validate(_json_body())
         
-        result = config_manager.disable_plugin(plugin_name, phases)
-        return jsonify(result)
+        result = get_config_manager().disable_plugin(plugin_name, body.phases)
+        if result['status'] != 'success':
+            return jsonify(result), 500
+        return jsonify(result), 202
+    except ConfigConflictError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 409
+    except ValidationError as e:
+        return _validation_error(e)
     except ValueError as e:
         return jsonify({
             'status': 'error',
@@ -414,23 +1036,35 @@ def disable_plugin(plugin_name):
 def update_plugin_config(plugin_name):
     """更新插件配置"""
     try:
-        data = request.get_json()
+        data = _json_body()
         if not data:
             return jsonify({
                 'status': 'error',
-                'message': '请求体不能为空'
+                'message': '请求体必须是非空对象'
             }), 400
+        args = validate_plugin_args(plugin_name, data)
         
-        results = []
-        for key, value in data.items():
-            result = config_manager.update_plugin_config(plugin_name, key, value)
-            results.append(result)
+        result = get_config_manager().update_plugin_configs(plugin_name, args)
+        if result['status'] != 'success':
+            return jsonify(result), 500
         
         return jsonify({
             'status': 'success',
             'message': f'插件 {plugin_name} 配置更新完成',
-            'results': results
-        })
+            'results': [result]
+        }), 202
+    except ConfigConflictError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 409
+    except ValidationError as e:
+        return _validation_error(e)
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
     except Exception as e:
         logger.error(f"更新插件配置失败: {e}")
         return jsonify({
@@ -438,20 +1072,118 @@ def update_plugin_config(plugin_name):
             'message': str(e)
         }), 500
 
+@app.route('/api/v1/plugins/config', methods=['PUT'])
+def update_plugins_config():
+    """更新多个插件的配置"""
+    try:
+        data = _json_body()
+        if not data:
+            return jsonify({
+                'status': 'error',
+                'message': '请求体必须是非空对象'
+            }), 400
+        
+        configs = {}
+        for plugin_name, kv in data.items():
+            if not isinstance(kv, dict) or not kv:
+                return jsonify({
+                    'status': 'error',
+                    'message': f'插件 {plugin_name} 的配置必须是非空对象'
+                }), 400
+            configs[plugin_name] = validate_plugin_args(plugin_name, kv)
+        
+        result = get_config_manager().update_multi_plugin_configs(configs)
+        if result['status'] != 'success':
+            return jsonify(result), 500
+        return jsonify(result), 202
+    except ConfigConflictError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 409
+    except ValidationError as e:
+        return _validation_error(e)
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"批量更新插件配置失败: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/v1/plugins/batch', methods=['POST'])
+def batch_plugin_changes():
+    """批量启用/禁用插件"""
+    try:
+        body = BatchReq.model_validate(_json_body())
+        changes = [change.model_dump() for change in body.changes]
+        
+        result = get_config_manager().apply_plugin_changes(changes)
+        if result['status'] != 'success':
+            return jsonify(result), 500
+        return jsonify(result), 202
+    except ConfigConflictError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 409
+    except ValidationError as e:
+        return _validation_error(e)
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"批量变更插件失败: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/v1/plugins/transaction', methods=['POST'])
+def plugin_transaction():
+    """在一次配置写入中执行多项插件操作"""
+    try:
+        body = TransactionReq.model_validate(_json_body())
+        ops = [op.model_dump(exclude_none=True) for op in body.ops]
+        
+        result = get_config_manager().apply_transaction(ops)
+        if result['status'] != 'success':
+            return jsonify(result), 500
+        return jsonify(result), 202
+    except ConfigConflictError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 409
+    except ValidationError as e:
+        return _validation_error(e)
+    except ValueError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"执行插件事务失败: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/v1/scheduler/restart', methods=['POST'])
 def restart_scheduler():
     """重启调度器"""
     try:
-        if config_manager.restart_scheduler():
-            return jsonify({
-                'status': 'success',
-                'message': '调度器重启成功'
-            })
-        else:
-            return jsonify({
-                'status': 'error',
-                'message': '调度器重启失败'
-            }), 500
+        get_config_manager().request_restart()
+        return jsonify({
+            'status': 'success',
+            'message': '调度器重启已提交'
+        }), 202
     except Exception as e:
         logger.error(f"重启调度器失败: {e}")
         return jsonify({
@@ -459,31 +1191,50 @@ def restart_scheduler():
             'message': str(e)
         }), 500
 
+@app.route('/api/v1/scheduler/restart/status', methods=['GET'])
+def restart_status():
+    """获取调度器重启状态"""
+    try:
+        return jsonify({
+            'status': 'success',
+            'data': get_config_manager().get_restart_status()
+        })
+    except Exception as e:
+        logger.error(f"获取调度器重启状态失败: {e}")
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/v1/health', methods=['GET'])
 def health_check():
-    """健康检查"""
+    """存活检查, 只反映进程本身是否可用"""
+    body = orjson.dumps({
+        'status': 'healthy',
+        'message': '服务正常运行',
+        'timestamp': datetime.now()
+    })
+    return Response(body, mimetype='application/json')
+
+@app.route('/api/v1/ready', methods=['GET'])
+def readiness_check():
+    """就绪检查, 检查Kubernetes连接"""
     try:
-        # 检查kubectl连接
-        result = subprocess.run(
-            ['kubectl', 'cluster-info'], 
-            capture_output=True, text=True, timeout=10
-        )
-        
-        if result.returncode == 0:
+        if get_config_manager().check_cluster():
             return jsonify({
-                'status': 'healthy',
-                'message': '服务正常运行',
+                'status': 'ready',
+                'message': 'Kubernetes连接正常',
                 'timestamp': datetime.now().isoformat()
             })
         else:
             return jsonify({
-                'status': 'unhealthy',
+                'status': 'unready',
                 'message': 'Kubernetes连接异常'
             }), 503
     except Exception as e:
-        logger.error(f"健康检查失败: {e}")
+        logger.error(f"就绪检查失败: {e}")
         return jsonify({
-            'status': 'unhealthy',
+            'status': 'unready',
             'message': str(e)
         }), 503
 
@@ -491,11 +1242,11 @@ def health_check():
 def backup_config():
     """备份当前配置"""
     try:
-        config_manager.backup_config()
+        get_config_manager().backup_config()
         return jsonify({
             'status': 'success',
-            'message': '配置备份成功'
-        })
+            'message': '配置备份已提交'
+        }), 202
     except Exception as e:
         logger.error(f"配置备份失败: {e}")
         return jsonify({
@@ -504,35 +1255,43 @@ def backup_config():
         }), 500
 
 # 错误处理
+# 固定内容的响应体在导入时序列化一次。Response对象仍按请求创建,
+# 因为CORS等after_request钩子会修改响应头, 不能在请求间共享。
+_NOT_FOUND_BODY = orjson.dumps({
+    'status': 'error',
+    'message': '接口不存在'
+})
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    'status': 'error',
+    'message': '服务器内部错误'
+})
+
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        'status': 'error',
-        'message': '接口不存在'
-    }), 404
+    return Response(_NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
-        'status': 'error',
-        'message': '服务器内部错误'
-    }), 500
+    return Response(_INTERNAL_ERROR_BODY, status=500, mimetype='application/json')
 
 if __name__ == '__main__':
     # 检查依赖
-    try:
-        subprocess.run(['kubectl', 'version'], check=True, capture_output=True)
-        logger.info("Kubernetes连接正常")
-    except subprocess.CalledProcessError:
-        logger.error("无法连接到Kubernetes集群")
-        exit(1)
-    except FileNotFoundError:
-        logger.error("kubectl命令未找到")
-        exit(1)
+    if not verify_cluster_connection():
+        sys.exit(1)
     
     # 启动服务
-    port = int(os.getenv('PORT', 8080))
-    host = os.getenv('HOST', '0.0.0.0')
+    from gunicorn.app.base import BaseApplication
+    import gunicorn_conf
+    
+    class APIServer(BaseApplication):
+        """以gunicorn多线程worker运行本服务"""
+        
+        def load_config(self):
+            for key in ('bind', 'workers', 'threads', 'worker_class', 'timeout', 'graceful_timeout'):
+                self.cfg.set(key, getattr(gunicorn_conf, key))
+        
+        def load(self):
+            return app
     
-    logger.info(f"启动插件配置API服务: {host}:{port}")
-    app.run(host=host, port=port, debug=False)
+    logger.info(f"启动插件配置API服务: {gunicorn_conf.bind}")
+    APIServer().run()